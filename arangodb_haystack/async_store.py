@@ -0,0 +1,340 @@
+"""
+This module contains an asynchronous implementation of the ArangoDB document store.
+The `AsyncArangoDBDocumentStore` class is a wrapper around the `arangoasync` package, the
+asynchronous Python client for ArangoDB. Its methods release the event loop during network I/O,
+so a single process can keep many requests in flight.
+"""
+import asyncio
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from aiohttp import TCPConnector
+from arangoasync import ArangoClient
+from arangoasync.auth import Auth
+from arangoasync.http import AioHTTPClient
+from haystack import Document
+
+from arangodb_haystack.store import (
+    BATCH_SIZE,
+    CURSOR_TTL,
+    DELETE_DOCUMENTS_QUERY,
+    UPDATE_DOCUMENTS_QUERY,
+    ArangoDBDocumentStoreConfig,
+    build_count_query,
+    build_delete_bind_vars,
+    build_filter_documents_query,
+    build_filter_query,
+    check_batch_size,
+    convert_from_arango_doc,
+    convert_to_arango_doc,
+    get_batch_keys,
+    get_document_key,
+    set_document_key,
+)
+
+
+class AsyncArangoDBDocumentStore:
+    """
+    An asynchronous document store that reads, writes, and deletes documents in an ArangoDB
+    collection.
+
+    The store connects when entering an async context and closes its client on exit:
+
+        async with AsyncArangoDBDocumentStore(config) as document_store:
+            await document_store.write_documents(documents)
+    """
+
+    __slots__ = ("config", "client", "db", "collection", "_coll_name", "_semaphore")
+
+    def __init__(self, config: ArangoDBDocumentStoreConfig):
+        self.config = config
+        self.client: Optional[ArangoClient] = None
+        self.db: Any = None
+        self.collection: Any = None
+        # Collection name used as the @@col bind variable in AQL queries
+        self._coll_name = config.collection_name
+        # Bounds the number of batches in flight to the connection pool size
+        self._semaphore = asyncio.Semaphore(config.pool_size)
+
+    async def connect(self) -> "AsyncArangoDBDocumentStore":
+        """
+        Connects to the database, return the store. An existing connection is closed first.
+        """
+        await self.close()
+
+        connector = TCPConnector(limit=self.config.pool_size, keepalive_timeout=60)
+        self.client = ArangoClient(hosts=self.config.connection_url,
+                                   http_client=AioHTTPClient(connector=connector))
+
+        self.db = await self.client.db(self.config.database_name,
+                                       auth=Auth(username=self.config.username,
+                                                 password=self.config.password),
+                                       verify=self.config.verify)
+
+        self.collection = self.db.collection(self.config.collection_name)
+        return self
+
+    async def close(self) -> None:
+        """
+        Closes the client and its connections.
+        """
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+            self.db = None
+            self.collection = None
+
+    async def __aenter__(self) -> "AsyncArangoDBDocumentStore":
+        return await self.connect()
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def count_documents(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Returns the number of documents stored.
+
+        Args:
+            filters: Optional dictionary specifying filters, only matching documents are
+                counted if provided.
+
+        Returns:
+            Number of documents.
+        """
+        if not filters:
+            return await self.collection.count()
+
+        # Count on the server so only the number is transferred
+        filter_query, bind_vars = build_filter_query(filters)
+        bind_vars["@col"] = self._coll_name
+
+        cursor = await self.db.aql.execute(build_count_query(filter_query), bind_vars=bind_vars)
+        async with cursor:
+            return await cursor.next()
+
+    async def write_documents(self, documents: Iterable[Document],
+                              batch_size: int = BATCH_SIZE) -> int:
+        """
+        Writes documents into the Document Store, return the number of documents
+        that were written.
+
+        Documents are consumed lazily and sent in bulk, up to batch_size documents per
+        request, with multiple requests running concurrently.
+
+        Args:
+            documents: Iterable of Haystack documents to write, e.g. a generator.
+            batch_size: Maximum number of documents per request, at least 1.
+
+        Returns:
+            Number of documents that were written.
+
+        Raises:
+            DocumentParseError: If a document ID belongs to another collection.
+            ValueError: If batch_size is less than 1.
+        """
+        # The import API matches existing documents by _key
+        arango_docs = (set_document_key(convert_to_arango_doc(doc), self._coll_name)
+                       for doc in documents)
+
+        return await self._run_batches(self._import_batch, arango_docs, batch_size)
+
+    async def _import_batch(self, arango_docs: List[Dict[str, Any]]) -> int:
+        """
+        Imports a batch of documents, return the number of documents that were written.
+        """
+        result = await self.collection.import_bulk(self.collection.serializer.dumps(arango_docs),
+                                                   doc_type="array",
+                                                   on_duplicate="update")
+        return result["created"] + result["updated"]
+
+    async def get_document(self, document_id: str) -> Document:
+        """
+        Get a document by its ID.
+        """
+        arango_doc = await self.collection.get(document_id)
+        return convert_from_arango_doc(arango_doc)
+
+    async def get_documents(self, document_ids: List[str]) -> List[Document]:
+        """
+        Get documents by their IDs in a single request, missing documents are skipped.
+
+        Args:
+            document_ids: List of document IDs or keys.
+
+        Returns:
+            List of Haystack Document objects that were found.
+
+        Raises:
+            DocumentParseError: If a document ID belongs to another collection.
+        """
+        keys = [get_document_key(document_id, self._coll_name) for document_id in document_ids]
+        arango_docs = await self.collection.get_many(keys)
+        return [convert_from_arango_doc(doc) for doc in arango_docs]
+
+    async def update_documents(self, documents: Iterable[Document]) -> int:
+        """
+        Writes (or overwrites) documents into the DocumentStore, return the number of documents
+        that were written.
+
+        Args:
+            documents: Iterable of Haystack documents to update.
+
+        Returns:
+            Number of documents that were written.
+
+        Raises:
+            DocumentParseError: If a document ID belongs to another collection.
+        """
+        # Only documents with an ID can be matched against existing ArangoDB documents
+        arango_docs = (set_document_key(convert_to_arango_doc(doc), self._coll_name)
+                       for doc in documents if doc.meta.get("id"))
+
+        return await self._run_batches(self._update_batch, arango_docs, BATCH_SIZE)
+
+    async def _update_batch(self, arango_docs: List[Dict[str, Any]]) -> int:
+        """
+        Updates a batch of documents, return the number of documents that were updated.
+        """
+        cursor = await self.db.aql.execute(
+            UPDATE_DOCUMENTS_QUERY,
+            bind_vars={"docs": arango_docs, "@col": self._coll_name},
+        )
+        async with cursor:
+            return await cursor.next()
+
+    async def _run_batches(self,
+                           func: Callable[[List[Dict[str, Any]]], Awaitable[int]],
+                           arango_docs: Iterable[Dict[str, Any]],
+                           batch_size: int) -> int:
+        """
+        Splits documents into batches of batch_size and awaits func for all batches
+        concurrently.
+
+        A batch is only formed once fewer than pool_size batches are in flight, so memory
+        stays bounded regardless of the input size. If a batch fails, the remaining
+        batches are cancelled and the error is raised.
+
+        Documents are applied in input order per _key: a batch sharing a _key with a batch
+        in flight waits for that batch, so the last occurrence of a document wins.
+
+        Args:
+            func: Coroutine function processing a batch of ArangoDB documents.
+            arango_docs: Iterable of ArangoDB documents.
+            batch_size: Maximum number of documents per batch.
+
+        Returns:
+            Sum of the results of func.
+
+        Raises:
+            ValueError: If batch_size is less than 1.
+        """
+        check_batch_size(batch_size)
+
+        docs = iter(arango_docs)
+        tasks: List[asyncio.Task] = []
+        # Keys written by the batches in flight
+        in_flight: Dict[asyncio.Future, Set[str]] = {}
+
+        def finish(task: asyncio.Future) -> None:
+            # Also releases the slot of tasks cancelled before they started
+            in_flight.pop(task, None)
+            self._semaphore.release()
+
+        try:
+            while True:
+                await self._semaphore.acquire()
+
+                try:
+                    batch = list(islice(docs, batch_size))
+                    keys = get_batch_keys(batch)
+
+                    # Wait for earlier batches writing one of the same documents
+                    overlapping = [task for task, task_keys in in_flight.items()
+                                   if not keys.isdisjoint(task_keys)]
+                    if overlapping:
+                        await asyncio.gather(*overlapping)
+                except BaseException:
+                    self._semaphore.release()
+                    raise
+
+                if not batch:
+                    self._semaphore.release()
+                    break
+
+                task = asyncio.ensure_future(func(batch))
+                in_flight[task] = keys
+                task.add_done_callback(finish)
+                tasks.append(task)
+
+            return sum(await asyncio.gather(*tasks))
+        except BaseException:
+            # Cancel the remaining batches instead of leaving them running unobserved
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def delete_documents(self, document_ids: List[str], ignore_missing=True) -> int:
+        """
+        Deletes all documents with matching document_ids from the Document Store, return
+        the number of documents that were deleted.
+
+        Args:
+            document_ids: List of document IDs or keys to delete.
+            ignore_missing: Skip documents that do not exist instead of failing.
+
+        Returns:
+            Number of documents that were deleted.
+
+        Raises:
+            DocumentParseError: If a document ID belongs to another collection.
+        """
+        cursor = await self.db.aql.execute(
+            DELETE_DOCUMENTS_QUERY,
+            bind_vars=build_delete_bind_vars(document_ids, self._coll_name, ignore_missing),
+        )
+        async with cursor:
+            return await cursor.next()
+
+    async def filter_documents(self, filters: Optional[Dict[str, Any]] = None,
+                               projection: Optional[List[str]] = None) -> List[Document]:
+        """
+        Return the documents that match the provided filters.
+
+        Args:
+            filters: Optional dictionary specifying filters for document retrieval.
+            projection: Optional list of meta fields to return, all meta fields are
+                returned if not provided.
+
+        Returns:
+            List of Haystack Document objects matching the filters.
+        """
+        return [doc async for doc in self.filter_documents_iter(filters, projection)]
+
+    async def filter_documents_iter(self, filters: Optional[Dict[str, Any]] = None,
+                                    projection: Optional[List[str]] = None
+                                    ) -> AsyncIterator[Document]:
+        """
+        Iterate over the documents that match the provided filters.
+
+        Results are streamed from the server in batches of BATCH_SIZE documents, so only
+        one batch is held in memory at a time. The server releases cursors that stay idle
+        for CURSOR_TTL seconds.
+
+        Args:
+            filters: Optional dictionary specifying filters for document retrieval.
+            projection: Optional list of meta fields to return, all meta fields are
+                returned if not provided.
+
+        Returns:
+            Async iterator of Haystack Document objects matching the filters.
+        """
+        query, bind_vars = build_filter_documents_query(self._coll_name, filters, projection)
+        cursor = await self.db.aql.execute(query, bind_vars=bind_vars,
+                                           batch_size=BATCH_SIZE, ttl=CURSOR_TTL,
+                                           options={"stream": True})
+
+        # Closing the cursor frees server resources if iteration stops early
+        async with cursor:
+            async for doc in cursor:
+                yield convert_from_arango_doc(doc)
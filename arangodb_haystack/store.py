@@ -4,18 +4,96 @@ The `ArangoDBDocumentStore` class is a wrapper around the `arango` package, whic
 client for ArangoDB. The `ArangoDBDocumentStore` class implements the `DocumentStore` protocol
 methods to read, write, and delete documents from an ArangoDB collection.
 """
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Protocol, Any, Optional
+from functools import lru_cache
+from itertools import chain, islice
+from operator import attrgetter
+from typing import (List, Dict, Protocol, Any, Optional, Tuple, Iterator, Callable,
+                    Iterable, Deque, Set, runtime_checkable)
 
 from arango import ArangoClient
+from arango.exceptions import DocumentParseError
+from arango.http import DefaultHTTPClient
 from haystack import Document
-from pandas import DataFrame
 
+try:
+    # pylint: disable=no-name-in-module
+    from orjson import OPT_NON_STR_KEYS, dumps as orjson_dumps, loads as orjson_loads
 
-@dataclass
+    def orjson_serializer(obj: Any) -> str:
+        """
+        Encodes obj with orjson, falling back to the json module for values orjson
+        rejects, e.g. integers wider than 64 bits.
+        """
+        try:
+            return orjson_dumps(obj, option=OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            return json.dumps(obj, separators=(",", ":"))
+
+    # orjson encodes and decodes JSON several times faster than the json module
+    SERIALIZERS: Dict[str, Callable[[Any], Any]] = {
+        "serializer": orjson_serializer,
+        "deserializer": orjson_loads,
+    }
+except ImportError:
+    # Fall back to the json module used by python-arango by default
+    SERIALIZERS = {}
+
+# Maximum number of documents sent to ArangoDB in a single bulk request
+BATCH_SIZE = 1000
+
+# Seconds a request waits for a free pooled connection before raising EmptyPoolError
+POOL_TIMEOUT = 60
+
+# Seconds an idle cursor is kept on the server before its results are released
+CURSOR_TTL = 60
+
+# Reads both attributes of a Haystack document in a single call
+get_content_and_meta = attrgetter("content", "meta")
+
+# Updates documents by their _key, see set_document_key, and returns the number of updated
+# documents, failed updates are not counted
+UPDATE_DOCUMENTS_QUERY = (
+    "FOR d IN @docs "
+    "UPDATE d IN @@col "
+    "OPTIONS {keepNull: true, mergeObjects: true, ignoreErrors: true} "
+    "COLLECT WITH COUNT INTO updated "
+    "RETURN updated"
+)
+
+# Deletes documents by key, see get_document_key, and returns the number of deleted documents
+DELETE_DOCUMENTS_QUERY = (
+    "FOR key IN @keys "
+    "REMOVE key IN @@col OPTIONS {ignoreErrors: @ignore} "
+    "COLLECT WITH COUNT INTO removed "
+    "RETURN removed"
+)
+
+# Filter operators and their AQL counterparts
+FILTER_OPERATORS = {
+    "$eq": "{field} == {value}",
+    "$ne": "{field} != {value}",
+    "$gt": "{field} > {value}",
+    "$gte": "{field} >= {value}",
+    "$lt": "{field} < {value}",
+    "$lte": "{field} <= {value}",
+    "$in": "{field} IN {value}",
+    "$nin": "{field} NOT IN {value}",
+    # Case-insensitive substring match, the value is turned into a LIKE pattern
+    "$contains": "LIKE({field}, {value}, true)",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ArangoDBDocumentStoreConfig:
     """
     Configuration for an ArangoDBDocumentStore.
+
+    Configurations are immutable and hashable, so they can be used as cache keys.
     """
     connection_url: str
     database_name: str
@@ -23,15 +101,86 @@ class ArangoDBDocumentStoreConfig:
     password: str
     collection_name: str
     verify: bool = False
+    pool_size: int = 10
+
+    def __post_init__(self):
+        if self.pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {self.pool_size}")
+
+
+@lru_cache(maxsize=32)
+def get_client(connection_url: str, pool_size: int) -> ArangoClient:
+    """
+    Returns an ArangoDB client for the given connection URL.
+
+    Clients are shared between stores connecting to the same URL with the same pool size,
+    so their stores reuse one connection pool.
+
+    Args:
+        connection_url: ArangoDB connection URL.
+        pool_size: Maximum number of pooled connections per host.
+
+    Returns:
+        ArangoDB client.
+    """
+    return ArangoClient(hosts=connection_url,
+                        http_client=DefaultHTTPClient(pool_maxsize=pool_size,
+                                                      pool_timeout=POOL_TIMEOUT),
+                        **SERIALIZERS)
 
 
-class ArangoDBDocumentStore(Protocol):
+@runtime_checkable
+class DocumentStoreProtocol(Protocol):
     """
     A protocol for a document store that can read, write, and delete documents.
     """
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes this store to a dictionary.
+        """
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DocumentStoreProtocol":
+        """
+        Deserializes the store from a dictionary.
+        """
+
+    def count_documents(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Returns the number of documents stored, only matching documents are counted
+        if filters are provided.
+        """
+
+    def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Return the documents that match the provided filters.
+        """
+
+    def write_documents(self, documents: Iterable[Document]) -> int:
+        """
+        Writes documents into the Document Store, return the number of documents
+        that were written.
+        """
+
+    def delete_documents(self, document_ids: List[str]) -> int:
+        """
+        Deletes all documents with matching document_ids from the Document Store, return
+        the number of documents that were deleted.
+        """
+
+
+class ArangoDBDocumentStore:
+    """
+    A document store that reads, writes, and deletes documents in an ArangoDB collection.
+
+    Implements DocumentStoreProtocol.
+    """
+
+    __slots__ = ("client", "db", "collection", "_coll_name", "_max_workers")
+
     def __init__(self, config: ArangoDBDocumentStoreConfig):
-        self.client = ArangoClient(hosts=config.connection_url)
+        self.client = get_client(config.connection_url, config.pool_size)
 
         self.db = self.client.db(config.database_name,
                                  config.username,
@@ -39,6 +188,10 @@ class ArangoDBDocumentStore(Protocol):
                                  verify=config.verify)
 
         self.collection = self.db.collection(config.collection_name)
+        # Collection name used as the @@col bind variable in AQL queries
+        self._coll_name = config.collection_name
+        # Batches are sent concurrently, capped by the connection pool size
+        self._max_workers = min((os.cpu_count() or 1) * 2, config.pool_size)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -48,7 +201,7 @@ class ArangoDBDocumentStore(Protocol):
             "type": "ArangoDBDocumentStore",
             "connection_url": self.client.hosts,
             "database_name": self.db.name,
-            "collection_name": self.collection.name,
+            "collection_name": self._coll_name,
         }
 
     @classmethod
@@ -58,22 +211,59 @@ class ArangoDBDocumentStore(Protocol):
         """
         return cls(**data)
 
-    def count_documents(self) -> int:
+    def count_documents(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Returns the number of documents stored.
+
+        Args:
+            filters: Optional dictionary specifying filters, only matching documents are
+                counted if provided.
+
+        Returns:
+            Number of documents.
+        """
+        if not filters:
+            return self.collection.count()
+
+        # Count on the server so only the number is transferred
+        filter_query, bind_vars = build_filter_query(filters)
+        bind_vars["@col"] = self._coll_name
+
+        cursor = self.db.aql.execute(build_count_query(filter_query), bind_vars=bind_vars)
+        return next(cursor)
+
+    def write_documents(self, documents: Iterable[Document], batch_size: int = BATCH_SIZE) -> int:
         """
-        return self.collection.count()
+        Writes documents into the Document Store, return the number of documents
+        that were written.
+
+        Documents are consumed lazily and sent in bulk, up to batch_size documents per
+        request, with multiple requests running concurrently.
 
-    def write_documents(self, documents: list[Document]):
+        Args:
+            documents: Iterable of Haystack documents to write, e.g. a generator.
+            batch_size: Maximum number of documents per request, at least 1.
+
+        Returns:
+            Number of documents that were written.
+
+        Raises:
+            DocumentParseError: If a document ID belongs to another collection.
+            ValueError: If batch_size is less than 1.
+        """
+        # Convert Haystack documents to ArangoDB document format (e.g., dictionary),
+        # the import API matches existing documents by _key
+        arango_docs = (set_document_key(convert_to_arango_doc(doc), self._coll_name)
+                       for doc in documents)
+
+        return self._run_batches(self._import_batch, arango_docs, batch_size)
+
+    def _import_batch(self, arango_docs: List[Dict[str, Any]]) -> int:
         """
-        Writes documents into the Document Store.
-        :param documents:
-        :return:
+        Imports a batch of documents, return the number of documents that were written.
         """
-        for doc in documents:
-            # Convert a Haystack document to ArangoDB document format (e.g., dictionary)
-            arango_doc = convert_to_arango_doc(doc)
-            self.collection.insert(arango_doc)
+        result = self.collection.import_bulk(arango_docs, on_duplicate="update")
+        return result["created"] + result["updated"]
 
     def get_document(self, document_id: str) -> Document:
         """
@@ -82,6 +272,23 @@ class ArangoDBDocumentStore(Protocol):
         arango_doc = self.collection.get(document_id)
         return convert_from_arango_doc(arango_doc)
 
+    def get_documents(self, document_ids: List[str]) -> List[Document]:
+        """
+        Get documents by their IDs in a single request, missing documents are skipped.
+
+        Args:
+            document_ids: List of document IDs or keys.
+
+        Returns:
+            List of Haystack Document objects that were found.
+
+        Raises:
+            DocumentParseError: If a document ID belongs to another collection.
+        """
+        keys = [get_document_key(document_id, self._coll_name) for document_id in document_ids]
+        arango_docs = self.collection.get_many(keys)
+        return [convert_from_arango_doc(doc) for doc in arango_docs]
+
     def update_documents(self, documents: List[Document]) -> int:
         """
         Writes (or overwrites) documents into the DocumentStore, return the number of documents
@@ -92,58 +299,145 @@ class ArangoDBDocumentStore(Protocol):
 
         Returns:
             Number of documents that were written.
+
+        Raises:
+            DocumentParseError: If a document ID belongs to another collection.
+        """
+
+        # Only documents with an ID can be matched against existing ArangoDB documents
+        arango_docs = (set_document_key(convert_to_arango_doc(doc), self._coll_name)
+                       for doc in documents if doc.meta.get("id"))
+
+        return self._run_batches(self._update_batch, arango_docs, BATCH_SIZE)
+
+    def _update_batch(self, arango_docs: List[Dict[str, Any]]) -> int:
+        """
+        Updates a batch of documents, return the number of documents that were updated.
         """
+        # Update all documents in a single query
+        cursor = self.db.aql.execute(
+            UPDATE_DOCUMENTS_QUERY,
+            bind_vars={"docs": arango_docs, "@col": self._coll_name},
+        )
+        return next(cursor)
+
+    def _run_batches(self,
+                     func: Callable[[List[Dict[str, Any]]], int],
+                     arango_docs: Iterable[Dict[str, Any]],
+                     batch_size: int) -> int:
+        """
+        Splits documents into batches of batch_size and calls func for each batch.
+
+        Batches are formed lazily and run concurrently on a thread pool. At most one batch
+        per worker is in flight, so memory stays bounded regardless of the input size.
 
-        updated_count = 0
-        for doc in documents:
-            arango_doc = convert_to_arango_doc(doc)
-            arango_id = doc.meta.get("id")  # Assuming Haystack document has an 'id' field in meta
+        Documents are applied in input order per _key: a batch sharing a _key with a batch
+        in flight waits for that batch, so the last occurrence of a document wins.
 
-            if not arango_id:
-                # Handle the case where a Haystack document doesn't have an ID for update
-                # ... (implement logic based on policy)
-                pass
-            else:
-                # Update an existing document based on Haystack document ID (arango_id)
-                update_result = self.collection.update(
-                    document=arango_doc, check_rev=True, merge=True, keep_none=True
-                )
-                if len(update_result.items()) == 0:
-                    # Handle potential update errors (e.g., logging or raising exceptions)
-                    pass
-                else:
-                    updated_count += 1
+        Args:
+            func: Function processing a batch of ArangoDB documents.
+            arango_docs: Iterable of ArangoDB documents.
+            batch_size: Maximum number of documents per batch.
 
-        return updated_count
+        Returns:
+            Sum of the results of func.
 
-    def delete_documents(self, document_ids: List[str], ignore_missing=True) -> None:
+        Raises:
+            ValueError: If batch_size is less than 1.
         """
-        Deletes all documents with matching document_ids from the Document Store.
+        check_batch_size(batch_size)
+
+        docs = iter(arango_docs)
+        batches = iter(lambda: list(islice(docs, batch_size)), [])
+
+        # A single batch stays on the calling thread, the pool is only started for more
+        first_batch = next(batches, [])
+        second_batch = next(batches, None)
+        if second_batch is None:
+            return func(first_batch) if first_batch else 0
+
+        total = 0
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            pending: Deque[Tuple[Future, Set[str]]] = deque()
+            for batch in chain((first_batch, second_batch), batches):
+                keys = get_batch_keys(batch)
+
+                # Wait for the oldest batch before forming more than one batch per worker,
+                # and for every earlier batch writing one of the same documents
+                while pending and (len(pending) >= self._max_workers
+                                   or any(not keys.isdisjoint(pending_keys)
+                                          for _, pending_keys in pending)):
+                    total += pending.popleft()[0].result()
+
+                pending.append((executor.submit(func, batch), keys))
+
+            total += sum(future.result() for future, _ in pending)
+
+        return total
+
+    def delete_documents(self, document_ids: List[str], ignore_missing=True) -> int:
         """
-        for document_id_to_delete in document_ids:
-            self.collection.delete(document_id_to_delete, ignore_missing=ignore_missing)
+        Deletes all documents with matching document_ids from the Document Store, return
+        the number of documents that were deleted.
 
-    def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        Args:
+            document_ids: List of document IDs or keys to delete.
+            ignore_missing: Skip documents that do not exist instead of failing.
+
+        Returns:
+            Number of documents that were deleted.
+
+        Raises:
+            DocumentParseError: If a document ID belongs to another collection.
+        """
+        # Delete all documents in a single query
+        cursor = self.db.aql.execute(
+            DELETE_DOCUMENTS_QUERY,
+            bind_vars=build_delete_bind_vars(document_ids, self._coll_name, ignore_missing),
+        )
+        return next(cursor)
+
+    def filter_documents(self, filters: Optional[Dict[str, Any]] = None,
+                         projection: Optional[List[str]] = None) -> List[Document]:
         """
         Return the documents that match the provided filters.
 
         Args:
             filters: Optional dictionary specifying filters for document retrieval.
+            projection: Optional list of meta fields to return, all meta fields are
+                returned if not provided.
 
         Returns:
             List of Haystack Document objects matching the filters.
         """
+        return list(self.filter_documents_iter(filters, projection))
 
-        if not filters:
-            # No filters provided, return all documents
-            cursor = self.collection.find({})
-        else:
-            # Build AQL filter query string based on provided filters
-            filter_query = build_filter_query(filters)
-            cursor = self.db.aql.execute(f"FOR doc IN {self.collection.name} "
-                                         f"FILTER {filter_query} RETURN doc")
+    def filter_documents_iter(self, filters: Optional[Dict[str, Any]] = None,
+                              projection: Optional[List[str]] = None) -> Iterator[Document]:
+        """
+        Iterate over the documents that match the provided filters.
+
+        Results are streamed from the server in batches of BATCH_SIZE documents, so only
+        one batch is held in memory at a time. The server releases cursors that stay idle
+        for CURSOR_TTL seconds.
+
+        Args:
+            filters: Optional dictionary specifying filters for document retrieval.
+            projection: Optional list of meta fields to return, all meta fields are
+                returned if not provided.
+
+        Returns:
+            Iterator of Haystack Document objects matching the filters.
+        """
+
+        query, bind_vars = build_filter_documents_query(self._coll_name, filters, projection)
+        cursor = self.db.aql.execute(query, bind_vars=bind_vars,
+                                     batch_size=BATCH_SIZE, ttl=CURSOR_TTL, stream=True)
 
-        return [convert_from_arango_doc(doc) for doc in cursor]
+        # Closing the cursor frees server resources if iteration stops early
+        with cursor:
+            for doc in cursor:
+                yield convert_from_arango_doc(doc)
 
 
 def convert_to_arango_doc(doc: Document) -> Dict[str, Any]:
@@ -157,23 +451,19 @@ def convert_to_arango_doc(doc: Document) -> Dict[str, Any]:
         Dictionary representing the ArangoDB document.
     """
 
-    arango_doc: dict[str, str | DataFrame | dict[str, Any] | Any] = {
-        "content": doc.content,
-        "meta": doc.meta.copy(),  # Create a copy to avoid modifying an original Haystack document
-    }
-
-    # Handle potential 'id' field in Haystack document meta
-    haystack_id = arango_doc["meta"].get("id")
+    content, meta = get_content_and_meta(doc)
+    haystack_id = meta.get("id")
 
+    # Build the document in a single pass, leaving 'id' out of the meta to avoid conflicts,
+    # and set ArangoDB _id attribute if a Haystack document has an 'id'
     if haystack_id:
-        del arango_doc["meta"]["id"]  # Remove 'id' from meta to avoid conflicts
-
-    # Set ArangoDB _id attribute if a Haystack document has an 'id'
-    arango_doc["_id"] = haystack_id
-
-    # ... (Add additional fields to arango_doc as needed)
+        return {
+            "content": content,
+            "meta": {key: value for key, value in meta.items() if key != "id"},
+            "_id": haystack_id,
+        }
 
-    return arango_doc
+    return {"content": content, "meta": dict(meta)}
 
 
 def convert_from_arango_doc(doc: Dict[str, Any]) -> Document:
@@ -182,29 +472,242 @@ def convert_from_arango_doc(doc: Dict[str, Any]) -> Document:
     :param doc:
     :return:
     """
-    meta = doc.get("meta", {})
-    meta = {**meta, "id": doc["_id"]}  # Combine dictionaries using spread operator
+    arango_id = doc["_id"]
+    meta = doc.get("meta") or {}
+
+    # Only copy the meta when the 'id' has to be added or corrected
+    if meta.get("id") != arango_id:
+        meta = {**meta, "id": arango_id}
+
+    content = doc.get("content")
     return Document(
-        content=str(doc.get("content", None)),
+        content=str(content) if content is not None else "",
         meta=meta,
     )
 
 
-def build_filter_query(filters: Dict[str, Any]) -> str:
+def get_document_key(document_id: str, collection_name: str) -> str:
+    """
+    Returns the key of a document ID or key of the given collection.
+
+    Args:
+        document_id: Document ID of the form "<collection>/<key>", or a document key.
+        collection_name: Name of the collection the document belongs to.
+
+    Returns:
+        The document key.
+
+    Raises:
+        DocumentParseError: If the document ID belongs to another collection.
+    """
+    collection, separator, key = document_id.partition("/")
+
+    if not separator:
+        return document_id
+
+    if collection != collection_name:
+        raise DocumentParseError(f'bad collection name in document ID "{document_id}"')
+
+    return key
+
+
+def set_document_key(arango_doc: Dict[str, Any], collection_name: str) -> Dict[str, Any]:
+    """
+    Replaces the _id of an ArangoDB document with its _key in place, see get_document_key.
+
+    Args:
+        arango_doc: ArangoDB document, e.g. returned by convert_to_arango_doc.
+        collection_name: Name of the collection the document belongs to.
+
+    Returns:
+        The ArangoDB document.
+    """
+    if "_id" in arango_doc:
+        arango_doc["_key"] = get_document_key(arango_doc.pop("_id"), collection_name)
+    return arango_doc
+
+
+def check_batch_size(batch_size: int) -> None:
+    """
+    Raises a ValueError if batch_size is less than 1.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+
+def get_batch_keys(arango_docs: List[Dict[str, Any]]) -> Set[str]:
+    """
+    Returns the keys of the documents in a batch, documents without a _key are skipped.
+    """
+    return {arango_doc["_key"] for arango_doc in arango_docs if "_key" in arango_doc}
+
+
+def build_delete_bind_vars(document_ids: List[str], collection_name: str,
+                           ignore_missing: bool) -> Dict[str, Any]:
+    """
+    Builds the bind variables of DELETE_DOCUMENTS_QUERY.
+
+    Args:
+        document_ids: List of document IDs or keys to delete, see get_document_key.
+        collection_name: Name of the collection to delete from.
+        ignore_missing: Skip documents that do not exist instead of failing.
+
+    Returns:
+        The bind variables of the query.
+    """
+    return {
+        "keys": [get_document_key(document_id, collection_name) for document_id in document_ids],
+        "@col": collection_name,
+        "ignore": ignore_missing,
+    }
+
+
+def build_filter_query(filters: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
     """
     Builds an AQL filter query string based on the provided filters' dictionary.
 
+    Plain values are matched by equality, while dictionaries map filter operators
+    (see FILTER_OPERATORS) to values, e.g. {"year": {"$gte": 2020, "$lt": 2024}}.
+    Nested fields are addressed with dots, e.g. "meta.category".
+
     Args:
         filters: Dictionary specifying filters for document retrieval.
 
+    Returns:
+        A tuple of the AQL filter query string and its bind variables.
+    """
+
+    shape = []
+    bind_vars: Dict[str, Any] = {}
+    for field_index, (field, condition) in enumerate(filters.items()):
+        # Fields and values are passed as bind variables so ArangoDB can use indexes
+        bind_vars[f"field_{field_index}"] = field.split(".")
+
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        elif not condition:
+            raise ValueError(f"Empty filter condition for field: {field}")
+
+        for value_index, (operator, value) in enumerate(condition.items()):
+            if operator == "$contains":
+                value = build_like_pattern(value)
+            bind_vars[f"value_{field_index}_{value_index}"] = value
+
+        shape.append(tuple(condition))
+
+    return build_filter_template(tuple(shape)), bind_vars
+
+
+def build_like_pattern(value: Any) -> str:
+    """
+    Builds a LIKE pattern matching values that contain the given value.
+
+    Args:
+        value: Value to search for, LIKE wildcards in it are matched literally.
+
+    Returns:
+        A string representing the LIKE pattern.
+    """
+    escaped = str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+@lru_cache(maxsize=256)
+def build_filter_template(shape: Tuple[Tuple[str, ...], ...]) -> str:
+    """
+    Builds the AQL filter query string for filters of the given shape.
+
+    Args:
+        shape: Filter operators of each filtered field, in filter order.
+
     Returns:
         A string representing the AQL filter query.
     """
 
     filter_parts = []
-    for field, value in filters.items():
-        # Implement logic to translate filter field and value to AQL syntax
-        # Consider different filter types (e.g., equality, range, etc.)
-        filter_parts.append(f"LIKE(doc.{field}, '%%{value}%%', true)")  # Example equality filter
+    for field_index, operators in enumerate(shape):
+        for value_index, operator in enumerate(operators):
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(f"Unsupported filter operator: {operator}")
+
+            filter_parts.append(FILTER_OPERATORS[operator].format(
+                field=f"doc.@field_{field_index}",
+                value=f"@value_{field_index}_{value_index}",
+            ))
+
+    # Combine filter parts with AND
+    return " AND ".join(filter_parts) if filter_parts else "true"
+
+
+def build_filter_documents_query(collection_name: str,
+                                 filters: Optional[Dict[str, Any]] = None,
+                                 projection: Optional[List[str]] = None
+                                 ) -> Tuple[str, Dict[str, Any]]:
+    """
+    Builds the AQL query returning the documents of a collection that match the filters.
+
+    Args:
+        collection_name: Name of the collection to query.
+        filters: Optional dictionary specifying filters for document retrieval.
+        projection: Optional list of meta fields to return.
 
-    return " AND ".join(filter_parts) if filter_parts else "true"  # Combine filter parts with AND
+    Returns:
+        A tuple of the AQL query string and its bind variables.
+    """
+
+    filter_query: Optional[str] = None
+    bind_vars: Dict[str, Any] = {}
+
+    if filters:
+        # Build AQL filter query string based on provided filters
+        filter_query, bind_vars = build_filter_query(filters)
+
+    bind_vars["@col"] = collection_name
+    if projection is not None:
+        bind_vars["projection"] = projection
+
+    # Query strings are cached, only the bind variables change between calls
+    return build_documents_query(filter_query, projection is not None), bind_vars
+
+
+@lru_cache(maxsize=256)
+def build_documents_query(filter_query: Optional[str], projected: bool) -> str:
+    """
+    Builds the AQL query returning the documents of the @@col collection.
+
+    Args:
+        filter_query: Optional AQL filter query string.
+        projected: Whether the meta fields are limited to the @projection bind variable.
+
+    Returns:
+        A string representing the AQL query.
+    """
+
+    query = "FOR doc IN @@col "
+
+    if filter_query:
+        query += f"FILTER {filter_query} "
+
+    # Only return the attributes needed to build Haystack documents, with the 'id' already
+    # in the meta so convert_from_arango_doc does not have to copy it
+    if projected:
+        query += ("RETURN {_id: doc._id, content: doc.content, "
+                  "meta: MERGE(KEEP(doc.meta, @projection), {id: doc._id})}")
+    else:
+        query += "RETURN {_id: doc._id, content: doc.content, meta: MERGE(doc.meta, {id: doc._id})}"
+
+    return query
+
+
+@lru_cache(maxsize=256)
+def build_count_query(filter_query: str) -> str:
+    """
+    Builds the AQL query counting the documents of the @@col collection.
+
+    Args:
+        filter_query: AQL filter query string.
+
+    Returns:
+        A string representing the AQL query.
+    """
+    return f"FOR doc IN @@col FILTER {filter_query} COLLECT WITH COUNT INTO total RETURN total"
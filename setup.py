@@ -39,5 +39,9 @@ setup(
         "python-arango>=7.9.0",
         "haystack-ai>=2.0.0",
     ],
-    python_requires='>=3.6',
+    extras_require={
+        "orjson": ["orjson"],
+        "async": ["python-arango-async"],
+    },
+    python_requires='>=3.10',
 )
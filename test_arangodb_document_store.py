@@ -0,0 +1,186 @@
+"""
+Tests for the ArangoDB document store, no server is required.
+"""
+import threading
+import time
+import unittest
+from dataclasses import replace
+from unittest.mock import patch
+
+from arangodb_haystack.store import (
+    ArangoDBDocumentStore,
+    ArangoDBDocumentStoreConfig,
+    DocumentStoreProtocol,
+    build_filter_query,
+    build_filter_template,
+    build_like_pattern,
+)
+
+CONFIG = ArangoDBDocumentStoreConfig(connection_url="http://localhost:8529",
+                                     database_name="test",
+                                     username="root",
+                                     password="",
+                                     collection_name="docs",
+                                     verify=False,
+                                     pool_size=2)
+
+
+class TestBuildFilterQuery(unittest.TestCase):
+    """
+    Tests building AQL filter queries from filter dictionaries.
+    """
+
+    def test_equality(self):
+        """
+        Plain values are matched by equality.
+        """
+        query, bind_vars = build_filter_query({"category": "news"})
+
+        self.assertEqual(query, "doc.@field_0 == @value_0_0")
+        self.assertEqual(bind_vars, {"field_0": ["category"], "value_0_0": "news"})
+
+    def test_range(self):
+        """
+        Operators on one field are combined with AND.
+        """
+        query, bind_vars = build_filter_query({"year": {"$gte": 2020, "$lt": 2024}})
+
+        self.assertEqual(query, "doc.@field_0 >= @value_0_0 AND doc.@field_0 < @value_0_1")
+        self.assertEqual(bind_vars, {"field_0": ["year"], "value_0_0": 2020, "value_0_1": 2024})
+
+    def test_nested_field(self):
+        """
+        Dotted field paths are bound as attribute paths.
+        """
+        _, bind_vars = build_filter_query({"meta.category": "news"})
+
+        self.assertEqual(bind_vars["field_0"], ["meta", "category"])
+
+    def test_contains(self):
+        """
+        $contains matches a LIKE pattern with the wildcards of the value escaped.
+        """
+        query, bind_vars = build_filter_query({"content": {"$contains": "50%_a\\b"}})
+
+        self.assertEqual(query, "LIKE(doc.@field_0, @value_0_0, true)")
+        self.assertEqual(bind_vars["value_0_0"], "%50\\%\\_a\\\\b%")
+        self.assertEqual(build_like_pattern(42), "%42%")
+
+    def test_empty_condition(self):
+        """
+        Empty conditions are rejected instead of leaving an unused bind variable.
+        """
+        with self.assertRaisesRegex(ValueError, "year"):
+            build_filter_query({"year": {}})
+
+    def test_unsupported_operator(self):
+        """
+        Unknown operators are rejected.
+        """
+        with self.assertRaisesRegex(ValueError, r"\$regex"):
+            build_filter_query({"content": {"$regex": "^a"}})
+
+    def test_template_cache(self):
+        """
+        Filters of the same shape reuse the cached query template.
+        """
+        build_filter_template.cache_clear()
+
+        first_query, _ = build_filter_query({"year": {"$gte": 2020}, "category": "news"})
+        second_query, second_bind_vars = build_filter_query({"year": {"$gte": 1999},
+                                                             "category": "sports"})
+
+        self.assertEqual(first_query, second_query)
+        self.assertEqual(second_bind_vars["value_0_0"], 1999)
+        self.assertEqual(build_filter_template.cache_info().hits, 1)
+
+
+class TestArangoDBDocumentStore(unittest.TestCase):
+    """
+    Tests the ArangoDBDocumentStore interface.
+    """
+
+    def test_implements_protocol(self):
+        """
+        The store implements DocumentStoreProtocol.
+        """
+        document_store: DocumentStoreProtocol = ArangoDBDocumentStore(CONFIG)
+
+        self.assertIsInstance(document_store, DocumentStoreProtocol)
+
+
+class TestRunBatches(unittest.TestCase):
+    """
+    Tests splitting documents into batches, the batch function is faked.
+    """
+
+    def setUp(self):
+        # Connections are only opened on the first request
+        self.store = ArangoDBDocumentStore(CONFIG)
+
+    def run_batches(self, func, docs, batch_size):
+        """
+        Runs the store's _run_batches.
+        """
+        return self.store._run_batches(func, docs, batch_size)  # pylint: disable=protected-access
+
+    def test_single_batch_runs_inline(self):
+        """
+        A single batch runs on the calling thread without starting the executor.
+        """
+        threads = []
+
+        def write_batch(batch):
+            threads.append(threading.current_thread())
+            return len(batch)
+
+        with patch("arangodb_haystack.store.ThreadPoolExecutor") as executor:
+            self.assertEqual(self.run_batches(write_batch, [{}, {}], 2), 2)
+            self.assertEqual(self.run_batches(write_batch, [], 2), 0)
+
+        executor.assert_not_called()
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def test_multiple_batches(self):
+        """
+        Results of all batches are summed.
+        """
+        self.assertEqual(self.run_batches(len, [{}] * 5, 2), 5)
+
+    def test_last_write_wins(self):
+        """
+        A batch writing a document of a batch in flight waits for it.
+        """
+        written = {}
+        lock = threading.Lock()
+
+        def write_batch(batch):
+            # The first batch is the slowest, it must not overwrite the later batches
+            time.sleep(0.05 if batch[0]["value"] == 0 else 0)
+            with lock:
+                written.update((doc["_key"], doc["value"]) for doc in batch)
+            return len(batch)
+
+        docs = [{"_key": "a", "value": 0}, {"_key": "b", "value": 1}, {"_key": "a", "value": 2}]
+
+        self.assertEqual(self.run_batches(write_batch, docs, 1), 3)
+        self.assertEqual(written, {"a": 2, "b": 1})
+
+    def test_invalid_pool_size(self):
+        """
+        Pool sizes below 1 are rejected instead of blocking every request.
+        """
+        with self.assertRaises(ValueError):
+            replace(CONFIG, pool_size=0)
+
+    def test_invalid_batch_size(self):
+        """
+        Batch sizes below 1 are rejected instead of writing nothing.
+        """
+        for batch_size in (0, -1):
+            with self.assertRaises(ValueError):
+                self.run_batches(len, [{}], batch_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
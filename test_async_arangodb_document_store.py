@@ -0,0 +1,166 @@
+"""
+Tests for the asynchronous ArangoDB document store, the ArangoDB executor is mocked so no
+server is required.
+"""
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from arango.exceptions import DocumentParseError
+from arangoasync.cursor import Cursor
+from haystack import Document
+
+from arangodb_haystack.async_store import AsyncArangoDBDocumentStore
+from arangodb_haystack.store import ArangoDBDocumentStoreConfig
+
+
+def make_cursor(rows: int) -> Cursor:
+    """
+    Returns a cursor as returned by the server for a query counting rows.
+    """
+    return Cursor(MagicMock(), {"result": [rows], "hasMore": False})
+
+
+class TestAsyncArangoDBDocumentStore(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests the AsyncArangoDBDocumentStore methods that run AQL queries.
+    """
+
+    def setUp(self):
+        config = ArangoDBDocumentStoreConfig(connection_url="http://localhost:8529",
+                                             database_name="test",
+                                             username="root",
+                                             password="",
+                                             collection_name="docs",
+                                             pool_size=2)
+        self.store = AsyncArangoDBDocumentStore(config)
+        self.store.db = MagicMock()
+        self.store.db.aql.execute = AsyncMock(side_effect=lambda *_, **__: make_cursor(2))
+
+    async def test_close(self):
+        """
+        Closing the store closes its client and drops the database handles.
+        """
+        client = self.store.client = MagicMock(close=AsyncMock())
+        self.store.collection = MagicMock()
+
+        await self.store.close()
+
+        client.close.assert_awaited_once()
+        self.assertIsNone(self.store.client)
+        self.assertIsNone(self.store.db)
+        self.assertIsNone(self.store.collection)
+
+    async def test_update_documents(self):
+        """
+        Documents are updated by key and the updated rows are counted.
+        """
+        documents = [Document(content="a", meta={"id": "docs/1"}),
+                     Document(content="b", meta={"id": "2"}),
+                     Document(content="c")]
+
+        self.assertEqual(await self.store.update_documents(documents), 2)
+
+        bind_vars = self.store.db.aql.execute.call_args.kwargs["bind_vars"]
+        self.assertEqual([doc["_key"] for doc in bind_vars["docs"]], ["1", "2"])
+        self.assertEqual(bind_vars["@col"], "docs")
+
+    async def test_update_documents_rejects_foreign_ids(self):
+        """
+        Documents of other collections are not updated.
+        """
+        documents = [Document(content="a", meta={"id": "other/1"})]
+
+        with self.assertRaises(DocumentParseError):
+            await self.store.update_documents(documents)
+
+        self.store.db.aql.execute.assert_not_called()
+
+    async def test_get_documents_rejects_foreign_ids(self):
+        """
+        Documents of other collections are not looked up.
+        """
+        self.store.collection = MagicMock()
+
+        with self.assertRaises(DocumentParseError):
+            await self.store.get_documents(["docs/1", "other/2"])
+
+        self.store.collection.get_many.assert_not_called()
+
+    async def test_delete_documents(self):
+        """
+        Documents are deleted by key and the deleted rows are counted.
+        """
+        self.assertEqual(await self.store.delete_documents(["docs/1", "2"]), 2)
+
+        bind_vars = self.store.db.aql.execute.call_args.kwargs["bind_vars"]
+        self.assertEqual(bind_vars["keys"], ["1", "2"])
+        self.assertTrue(bind_vars["ignore"])
+
+    async def test_delete_documents_rejects_foreign_ids(self):
+        """
+        Documents of other collections are not deleted.
+        """
+        with self.assertRaises(DocumentParseError):
+            await self.store.delete_documents(["docs/1", "other/2"])
+
+        self.store.db.aql.execute.assert_not_called()
+
+    async def test_write_documents_rejects_invalid_batch_size(self):
+        """
+        Batch sizes below 1 are rejected instead of writing nothing.
+        """
+        for batch_size in (0, -1):
+            with self.assertRaises(ValueError):
+                await self.store.write_documents([Document(content="a")], batch_size=batch_size)
+
+    async def test_last_write_wins(self):
+        """
+        A batch writing a document of a batch in flight waits for it.
+        """
+        written = {}
+
+        async def write_batch(batch):
+            # The first batch is the slowest, it must not overwrite the later batches
+            await asyncio.sleep(0.01 if batch[0]["value"] == 0 else 0)
+            written.update((doc["_key"], doc["value"]) for doc in batch)
+            return len(batch)
+
+        docs = [{"_key": "a", "value": 0}, {"_key": "b", "value": 1}, {"_key": "a", "value": 2}]
+
+        self.assertEqual(await self.store._run_batches(write_batch, docs, 1), 3)  # pylint: disable=protected-access
+        self.assertEqual(written, {"a": 2, "b": 1})
+
+    async def test_failed_batch_cancels_pending_batches(self):
+        """
+        A failed batch cancels the batches still in flight and releases their slots.
+        """
+        started = asyncio.Event()
+        cancelled = []
+
+        async def pending_batch(_):
+            try:
+                started.set()
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def failed_batch(_):
+            await started.wait()
+            raise RuntimeError("batch failed")
+
+        batches = iter([pending_batch, failed_batch])
+
+        async def run_batch(batch):
+            return await next(batches)(batch)
+
+        with self.assertRaises(RuntimeError):
+            await self.store._run_batches(run_batch, [{}, {}], 1)  # pylint: disable=protected-access
+
+        self.assertEqual(cancelled, [True])
+        self.assertFalse(self.store._semaphore.locked())  # pylint: disable=protected-access
+
+
+if __name__ == "__main__":
+    unittest.main()